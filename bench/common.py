@@ -0,0 +1,72 @@
+# Shared helpers for the benchmark scripts: serve the app on a local port and
+# report latency percentiles. Scripts that load data point DATABASE_URL at a
+# scratch database first, they drop and recreate every table.
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def load_app():
+    if 'DATABASE_URL' not in os.environ:
+        sys.exit("Set DATABASE_URL to a scratch database, e.g. mysql+mysqlconnector://root:pw@localhost/bench "
+                 "or sqlite:////tmp/bench.db. All tables in it are dropped.")
+    import app as app_module
+    with app_module.app.app_context():
+        app_module.db.drop_all()
+        app_module.db.create_all()
+    return app_module
+
+def import_app():
+    # For benchmarks that never touch the database. Importing the app runs create_all(),
+    # so without DATABASE_URL it gets a throwaway SQLite file instead of MySQL.
+    os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.gettempdir(), 'ct-ecommerce-bench.db')}")
+    import app as app_module
+    return app_module
+
+def serve(app):
+    # Threaded werkzeug server on a free port, one thread per connection like `flask run`
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+class Client:
+    # One keep-alive connection per worker thread
+    def __init__(self, server):
+        self.connection = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=120)
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        data = response.read()
+        return response.status, json.loads(data) if data else None
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def latency_summary(latencies):
+    values = sorted(latencies)
+    return {name: round(percentile(values, fraction) * 1000, 2)
+            for name, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99), ("max_ms", 1.0))}
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
@@ -0,0 +1,63 @@
+# Customer validation on bulk-import sized input: the precompiled fast path
+# (is_valid_customer_row) and CustomerSchema against the validate.Regexp schema
+# CustomerSchema used before the patterns were precompiled.
+#
+#   python bench/customer_validation.py --rows 10000
+import argparse
+import timeit
+
+from marshmallow import Schema, ValidationError, fields, validate
+
+from common import import_app
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--rows', type=int, default=10000)
+parser.add_argument('--repeat', type=int, default=5)
+args = parser.parse_args()
+
+app_module = import_app()
+
+class RegexpCustomerSchema(Schema):
+    name = fields.String(required=True, validate=validate.Length(min=2))
+    email = fields.String(required=True, validate=validate.Regexp(regex=r"^[\w\.]+@([\w-]+\.)+[\w-]{2,4}$", error="E-mail is invalid"))
+    phone = fields.String(required=True, validate=validate.Regexp(regex=r'^[+]*[(]{0,1}[0-9]{1,4}[)]{0,1}[-\s\./0-9]{5,9}$', error="Phone number is invalid"))
+
+    class Meta:
+        fields = ("name", "email", "phone", "id")
+
+regexp_schema = RegexpCustomerSchema()
+rows = [{"name": f"Customer {index}", "email": f"customer{index}@example.com", "phone": "555-123-4567"} for index in range(args.rows)]
+invalid_rows = [{"name": "A", "email": "not-an-email", "phone": "12"}, {"name": "Bo", "email": "bo@example.com"}]
+
+def load_each(schema):
+    for row in rows:
+        schema.load(row)
+
+def fast_path():
+    for row in rows:
+        if not app_module.is_valid_customer_row(row):
+            app_module.customer_schema.load(row)
+
+with app_module.app.app_context():
+    # Same accepted rows and the same error messages as before
+    assert all(app_module.is_valid_customer_row(row) for row in rows)
+    for row in invalid_rows:
+        assert not app_module.is_valid_customer_row(row)
+        messages = []
+        for schema in (regexp_schema, app_module.customer_schema):
+            try:
+                schema.load(row)
+            except ValidationError as e:
+                messages.append(e.messages)
+        assert len(messages) == 2 and messages[0] == messages[1], messages
+    cases = {
+        "validate.Regexp schema, load per row": lambda: load_each(regexp_schema),
+        "CustomerSchema, load per row": lambda: load_each(app_module.customer_schema),
+        "is_valid_customer_row fast path": fast_path,
+    }
+    print(f"{args.rows} valid customer rows, best of {args.repeat}")
+    baseline = None
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f"{name}: {seconds * 1000:.1f} ms ({baseline / seconds:.1f}x)")
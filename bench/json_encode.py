@@ -0,0 +1,37 @@
+# JSON encoding of a list response: FastJSONProvider (orjson when installed) against
+# Flask's stdlib DefaultJSONProvider, on customer rows shaped like GET /customers.
+#
+#   python bench/json_encode.py --rows 10000
+import argparse
+import json
+import timeit
+
+from flask.json.provider import DefaultJSONProvider
+
+from common import import_app
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--rows', type=int, default=10000)
+parser.add_argument('--repeat', type=int, default=20)
+args = parser.parse_args()
+
+app_module = import_app()
+app = app_module.app
+payload = {"customers": [{"id": index, "name": f"Customer {index}", "email": f"customer{index}@example.com", "phone": "5551234567"}
+                         for index in range(args.rows)], "next": args.rows}
+providers = {"stdlib": DefaultJSONProvider(app), "fast": app_module.FastJSONProvider(app)}
+
+with app.app_context():
+    # The encodings must describe the same data
+    decoded = {name: json.loads(provider.dumps(payload)) for name, provider in providers.items()}
+    assert decoded["stdlib"] == decoded["fast"]
+    print(f"orjson installed: {app_module.orjson is not None}")
+    print(f"{args.rows} customer rows, best of {args.repeat}")
+    timings = {}
+    for name, provider in providers.items():
+        timings[name] = min(timeit.repeat(lambda: provider.dumps(payload), number=1, repeat=args.repeat))
+        # jsonify encodes with compact separators when not in debug mode
+        compact = min(timeit.repeat(lambda: provider.dumps(payload, separators=(",", ":")), number=1, repeat=args.repeat))
+        print(f"{name}: dumps {timings[name] * 1000:.2f} ms, compact dumps {compact * 1000:.2f} ms, "
+              f"{len(provider.dumps(payload))} characters")
+    print(f"speedup: {timings['stdlib'] / timings['fast']:.1f}x")
@@ -0,0 +1,49 @@
+# Login latency at a fixed concurrency: every thread logs in repeatedly with its own
+# account and the script reports p50/p95/p99 latency, throughput and 503s from the
+# bounded password hashing pool.
+#
+#   DATABASE_URL=sqlite:////tmp/bench.db python bench/login_latency.py --threads 16 --logins 10
+import argparse
+import time
+from collections import Counter
+
+from common import Client, latency_summary, load_app, run_threads, serve
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--threads', type=int, default=16, help="concurrent clients")
+parser.add_argument('--logins', type=int, default=10, help="logins per client")
+args = parser.parse_args()
+
+app_module = load_app()
+db = app_module.db
+with app_module.app.app_context():
+    db.session.add(app_module.Customer(name="Bench", email="bench@example.com", phone="5550000000"))
+    db.session.add_all(app_module.CustomerAccount(username=f"bench-{index}", password=app_module.hash_password("bench-password"), customer_id=1)
+                       for index in range(args.threads))
+    db.session.commit()
+    database = db.engine.url.render_as_string(hide_password=True)
+
+server = serve(app_module.app)
+statuses = Counter()
+latencies = []
+
+def log_in(index):
+    client = Client(server)
+    for _ in range(args.logins):
+        started = time.perf_counter()
+        status, _ = client.request('POST', '/login', {"username": f"bench-{index}", "password": "bench-password"})
+        latencies.append(time.perf_counter() - started)
+        statuses[status] += 1
+
+started = time.perf_counter()
+run_threads(args.threads, log_in)
+elapsed = time.perf_counter() - started
+server.shutdown()
+
+total = args.threads * args.logins
+print(f"database: {database}")
+print(f"{total} logins from {args.threads} threads, {app_module.PASSWORD_HASH_METHOD}, "
+      f"{app_module.PASSWORD_HASH_WORKERS} hash workers, {app_module.PASSWORD_HASH_MAX_PENDING} max pending")
+print(f"elapsed {elapsed:.2f}s, {total / elapsed:.1f} logins/s")
+print(f"statuses: {dict(sorted(statuses.items()))}")
+print(f"latency: {latency_summary(latencies)}")
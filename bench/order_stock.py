@@ -0,0 +1,70 @@
+# Concurrent orders against a few hot products: checks that stock is never oversold
+# and reports order throughput and latency.
+#
+#   DATABASE_URL=mysql+mysqlconnector://root:pw@localhost/bench python bench/order_stock.py --threads 64
+import argparse
+import random
+import time
+from collections import Counter
+
+from common import Client, latency_summary, load_app, run_threads, serve
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--threads', type=int, default=32)
+parser.add_argument('--orders', type=int, default=50, help="orders placed by each thread")
+parser.add_argument('--products', type=int, default=4, help="number of hot products")
+parser.add_argument('--stock', type=int, default=500, help="starting stock of each product")
+parser.add_argument('--max-lines', type=int, default=3, help="max products per order")
+parser.add_argument('--max-quantity', type=int, default=3)
+args = parser.parse_args()
+
+app_module = load_app()
+db, Product, order_product = app_module.db, app_module.Product, app_module.order_product
+with app_module.app.app_context():
+    db.session.add(app_module.Customer(name="Bench", email="bench@example.com", phone="5550000000"))
+    db.session.add_all(Product(name=f"hot-{index}", price=1.0, stock=args.stock) for index in range(args.products))
+    db.session.commit()
+    product_ids = db.session.scalars(db.select(Product.id)).all()
+
+server = serve(app_module.app)
+statuses = Counter()
+latencies = []
+
+def place_orders(index):
+    client = Client(server)
+    rng = random.Random(index)
+    for _ in range(args.orders):
+        items = [{"product_id": id, "quantity": rng.randint(1, args.max_quantity)}
+                 for id in rng.sample(product_ids, rng.randint(1, min(args.max_lines, len(product_ids))))]
+        started = time.perf_counter()
+        status, _ = client.request('POST', '/orders', {"customer_id": 1, "date": "2024-07-15", "items": items})
+        latencies.append(time.perf_counter() - started)
+        statuses[status] += 1
+
+started = time.perf_counter()
+run_threads(args.threads, place_orders)
+elapsed = time.perf_counter() - started
+server.shutdown()
+
+# Every unit sold must have come out of stock, and no stock may go negative
+with app_module.app.app_context():
+    sold = dict(db.session.execute(db.select(order_product.c.product_id, db.func.sum(order_product.c.quantity))
+                                   .group_by(order_product.c.product_id)).all())
+    stock = dict(db.session.execute(db.select(Product.id, Product.stock)).all())
+    orders = db.session.scalar(db.select(db.func.count(app_module.Order.id)))
+    database = db.engine.url.render_as_string(hide_password=True)
+oversold = [id for id in product_ids if stock[id] < 0 or stock[id] + sold.get(id, 0) != args.stock]
+
+total = args.threads * args.orders
+print(f"database: {database}")
+print(f"{total} orders from {args.threads} threads on {args.products} products with {args.stock} units each")
+print(f"elapsed {elapsed:.2f}s, {total / elapsed:.1f} requests/s, {statuses[201] / elapsed:.1f} orders placed/s")
+print(f"statuses: {dict(sorted(statuses.items()))}")
+print(f"latency: {latency_summary(latencies)}")
+print(f"stock left: {[stock[id] for id in product_ids]}, sold: {[sold.get(id, 0) for id in product_ids]}")
+print(f"orders in database: {orders}, 201 responses: {statuses[201]}")
+if oversold:
+    raise SystemExit(f"FAILED: stock does not add up for products {oversold}")
+if orders != statuses[201]:
+    raise SystemExit("FAILED: orders in the database do not match the 201 responses")
+print("OK: no product oversold, every placed order is accounted for")